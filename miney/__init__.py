@@ -5,8 +5,9 @@ from .minetest import Minetest
 from .player import Player
 from .chat import Chat
 from .node import Node
-from .lua import Lua
+from .lua import Lua, LuaBatch
 from .inventory import Inventory
+from .settings import SettingsView
 from .exceptions import *
 from .tool import ToolIterable
 from .player import PlayerIterable
@@ -1,5 +1,3 @@
-import string
-from random import choices
 import miney
 
 
@@ -18,7 +16,7 @@ class Callback:
         :return: None
         """
         # Match answer to request
-        result_id = ''.join(choices(string.ascii_lowercase + string.ascii_uppercase + string.digits, k=6))
+        result_id = str(next(self.mt._result_ids))
 
         self.mt.send(
             {
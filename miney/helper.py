@@ -2,9 +2,14 @@ import socket
 import time
 import os
 import platform
+import shutil
 import subprocess
 import webbrowser
+from pathlib import Path
 import miney
+from .exceptions import MinetestRunError
+
+_MINETEST_EXE = "minetest.exe" if platform.system() == 'Windows' else "minetest"
 
 
 def is_miney_available(ip: str = "127.0.0.1", port: int = 29999, timeout: int = 1.0) -> bool:
@@ -18,15 +23,13 @@ def is_miney_available(ip: str = "127.0.0.1", port: int = 29999, timeout: int =
     :return: True or False
     """
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
     s.settimeout(timeout)
     try:
         s.connect((ip, int(port)))
         s.send(b"ping\n")
-        reply = s.recv(4096).decode()
-        if reply == "pong\n":
-            return True
-        else:
-            return False
+        return s.recv(4096) == b"pong\n"  # compare the raw reply, no need to decode it
     except (socket.timeout, ConnectionResetError, ConnectionRefusedError):
         return False
     finally:
@@ -41,18 +44,16 @@ def run_miney_game():
     :return: None
     """
     if is_miney_available():
-        raise miney.MinetestRunError("A miney game is already running")
+        raise MinetestRunError("A miney game is already running")
     else:
         run_minetest(show_menu=False)
-        wait = 0
-        while wait < 12:
-            time.sleep(1)
-            available = is_miney_available()
-            if available:
+        deadline = time.monotonic() + 12
+        while time.monotonic() < deadline:
+            time.sleep(0.25)  # short polls, so we return soon after mineysocket is up
+            if is_miney_available():
                 time.sleep(2)  # some extra time to get everything initialized
                 return True
-            wait = wait + 1
-        raise miney.MinetestRunError("Timeout while waiting for minetest with an open mineysocket")
+        raise MinetestRunError("Timeout while waiting for minetest with an open mineysocket")
 
 
 def run_minetest(
@@ -72,55 +73,40 @@ def run_minetest(
     :return: None
     """
     if not minetest_path:
-        if os.environ.get('MINETEST_BIN') and os.path.isfile(os.environ.get('MINETEST_BIN')):
-            minetest_path = os.environ['MINETEST_BIN']
+        minetest_bin = os.environ.get('MINETEST_BIN')
+        if minetest_bin and os.path.isfile(minetest_bin):
+            minetest_path = minetest_bin
         else:
-            if platform.system() == 'Windows':
-                exe_name = "minetest.exe"
-            else:
-                exe_name = "minetest"
-
             # we have to guess the path
             possible_paths = [
                 os.path.join(os.getcwd(), "Minetest", "bin"),
             ]
-            for p in possible_paths:
-                path = os.path.join(p, exe_name)
-                if os.path.isfile(path):
-                    minetest_path = os.path.join(p, exe_name)
-                    break
-                else:
-                    raise miney.MinetestRunError("Minetest was not found")
+            # search all candidates at once
+            minetest_path = shutil.which(
+                _MINETEST_EXE, path=os.pathsep.join(p for p in possible_paths if os.path.isdir(p))
+            )
+            if not minetest_path:
+                raise MinetestRunError("Minetest was not found")
     if world_path == "Miney":
         world_path = os.path.abspath(os.path.join(minetest_path, "..", "..", "worlds", "miney"))
 
         if not os.path.isdir(world_path):  # We have to create the default world
-            if not os.path.isdir(os.path.abspath(os.path.join(world_path, "..", "..", "worlds"))):
-                os.mkdir(os.path.abspath(os.path.join(world_path, "..", "..", "worlds")))
-            os.mkdir(world_path)
-            with open(os.path.join(world_path, "world.mt"), "w") as world_config_file:
-                world_config_file.write(
-                    "enable_damage = true\ncreative_mode = false\ngameid = minetest\nplayer_backend = sqlite3\n"
-                    "backend = sqlite3\nauth_backend = sqlite3\nload_mod_mineysocket = true\nserver_announce = false\n"
-                )
-            with open(os.path.join(world_path, "map_meta.txt"), "w") as world_meta_file:
-                world_meta_file.write(f"seed = {seed}")
+            os.makedirs(world_path, exist_ok=True)
+            Path(world_path, "world.mt").write_text(
+                "enable_damage = true\ncreative_mode = false\ngameid = minetest\nplayer_backend = sqlite3\n"
+                "backend = sqlite3\nauth_backend = sqlite3\nload_mod_mineysocket = true\nserver_announce = false\n"
+            )
+            Path(world_path, "map_meta.txt").write_text(f"seed = {seed}")
 
     if not os.path.isdir(os.path.abspath(os.path.join(minetest_path, "..", "..", "mods", "mineysocket"))):
-        raise miney.MinetestRunError("Mineysocket mod is not installed")
+        raise MinetestRunError("Mineysocket mod is not installed")
 
     # todo: run_minetest - implementation for linux/macos
 
-    if show_menu:
-        subprocess.Popen(
-            f"{minetest_path} "
-            f"--world \"{world_path}\" --name {miney.default_playername} --address \"\""
-        )
-    else:
-        subprocess.Popen(
-            f"{minetest_path} "
-            f"--go --world \"{world_path}\" --name {miney.default_playername} --address \"\""
-        )
+    args = [minetest_path, "--world", world_path, "--name", miney.default_playername, "--address", ""]
+    if not show_menu:
+        args.insert(1, "--go")
+    subprocess.Popen(args)
 
 
 def doc() -> None:
@@ -1,5 +1,9 @@
 import miney
 
+# Lua templates for the player inventory, filled with "%" formatting and values quoted by Lua.dumps
+_PLAYER_ADD = 'minetest.get_inventory({type = "player", name = %s}):add_item("main", ItemStack(%s))'
+_PLAYER_REMOVE = 'minetest.get_inventory({type = "player", name = %s}):remove_item("main", ItemStack(%s))'
+
 
 class Inventory:
     """
@@ -20,9 +24,7 @@ class Inventory:
         """
         if isinstance(self.parent, miney.Player):
             self.mt.lua.run(
-                f"minetest.get_inventory("
-                f"{{type = \"player\", name = \"{self.parent.name}\"}}"
-                f"):add_item(\"main\", ItemStack(\"{item} {amount}\"))"
+                _PLAYER_ADD % (self.mt.lua.dumps(self.parent.name), self.mt.lua.dumps(f"{item} {amount}"))
             )
 
     def remove(self, item: str, amount: int = 1) -> None:
@@ -35,5 +37,5 @@ class Inventory:
         """
         if isinstance(self.parent, miney.Player):
             self.mt.lua.run(
-                f"minetest.get_inventory({{type = \"player\", "
-                f"name = \"{self.parent.name}\"}}):remove_item(\"main\", ItemStack(\"{item} {amount}\"))")
+                _PLAYER_REMOVE % (self.mt.lua.dumps(self.parent.name), self.mt.lua.dumps(f"{item} {amount}"))
+            )
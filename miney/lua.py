@@ -1,6 +1,5 @@
-import re
-import string
-from random import choices
+import io
+from functools import lru_cache
 import miney
 
 
@@ -8,6 +7,8 @@ class Lua:
     """
     Lua specific functions.
     """
+    __slots__ = ("mt",)
+
     def __init__(self, mt: miney.Minetest):
         self.mt = mt
 
@@ -19,8 +20,8 @@ class Lua:
         :param timeout: How long to wait for a result
         :return: The return value. Multiple values as a list.
         """
-        # generates nearly unique id's (under 1000 collisions in 10 million values)
-        result_id = ''.join(choices(string.ascii_lowercase + string.ascii_uppercase + string.digits, k=6))
+        # unique per Minetest object, cheaper than random id's
+        result_id = str(next(self.mt._result_ids))
 
         self.mt.send({"lua": lua_code, "id": result_id})
 
@@ -30,6 +31,60 @@ class Lua:
             # We rerun the code, cause he was dropped during reconnect
             return self.run(lua_code, timeout=timeout)
 
+    def call(self, function: str, *args, timeout: float = 10.0):
+        """
+        Call a Lua function on the minetest server. The arguments are converted with :meth:`dumps`, so they don't
+        need any quoting or escaping.
+
+        :Example:
+
+            >>> mt.lua.call("minetest.chat_send_all", "Hello \\"world\\"")
+
+        :param function: Name of the Lua function, like "minetest.log"
+        :param args: Arguments for the function
+        :param timeout: How long to wait for a result
+        :return: The return value. Multiple values as a list.
+        """
+        return self.run(f"return {function}({', '.join(_dumps(arg) for arg in args)})", timeout=timeout)
+
+    def batch(self, timeout: float = 10.0) -> 'LuaBatch':
+        """
+        Collect multiple Lua snippets and run them with a single request. Every snippet is compiled and run on its
+        own, so a failing snippet doesn't stop the others, even with a syntax error. The results are available after
+        the with block.
+        If snippets failed, the batch raises the first :class:`miney.LuaError` after all results were stored.
+
+        :Example:
+
+            >>> with mt.lua.batch() as batch:
+            >>>     batch.run("return minetest.get_timeofday()")
+            >>>     batch.run("return minetest.get_version().string")
+            >>> batch.results
+            [0.5, '5.3.0']
+
+        :param timeout: How long to wait for the results
+        :return: :class:`miney.LuaBatch` object
+        """
+        return LuaBatch(self, timeout)
+
+    def run_many(self, lua_codes: list, timeout: float = 10.0) -> list:
+        """
+        Run a list of Lua snippets with a single request, like :meth:`batch` without the with block.
+
+        :Example:
+
+            >>> mt.lua.run_many(["return minetest.get_timeofday()", "return minetest.get_version().string"])
+            [0.5, '5.3.0']
+
+        :param lua_codes: Lua snippets to run
+        :param timeout: How long to wait for the results
+        :return: A list with the return value of every snippet. Multiple values as a tuple.
+        """
+        batch = LuaBatch(self, timeout)
+        for lua_code in lua_codes:
+            batch.run(lua_code)
+        return batch.flush()
+
     def run_file(self, filename):
         """
         Loads and runs Lua code from a file. This is useful for debugging, cause Minetest can throws errors with
@@ -48,26 +103,182 @@ class Lua:
         :param data: Python data
         :return: Lua data
         """
-        # credits:
-        # https://stackoverflow.com/questions/54392760/serialize-a-dict-as-lua-table/54392761#54392761
-        if type(data) is str:
-            return '"{}"'.format(re.escape(data))
-        if type(data) in (int, float):
-            return '{}'.format(data)
-        if type(data) is bool:
-            return data and "true" or "false"
-        if type(data) is list:
-            l = "{"
-            l += ", ".join([self.dumps(item) for item in data])
-            l += "}"
-            return l
-        if type(data) is dict:
-            t = "{"
-            t += ", ".join(
-                [
-                    '[\"{}\"]={}'.format(re.escape(k), self.dumps(v)) for k, v in data.items()
-                ]
-            )
-            t += "}"
-            return t
-        raise ValueError("Unknown type {}".format(type(data)))
\ No newline at end of file
+        return _dumps(data)
+
+
+def _dumps(data) -> str:
+    buf = io.StringIO()
+    _dump_into(buf.write, data)
+    return buf.getvalue()
+
+
+# Every batch snippet is compiled on its own, so even a syntax error only fails its own result
+_BATCH_HEAD = """local results = {}
+local function run(code)
+    local func, err = (loadstring or load)(code)
+    if not func then
+        return {false, err}
+    end
+    return {pcall(func)}
+end
+"""
+
+
+class LuaBatch:
+    """
+    Lua snippets, that are sent to minetest with a single request. Use it with :meth:`miney.Lua.batch`.
+    """
+    __slots__ = ("lua", "timeout", "lua_codes", "results")
+
+    def __init__(self, lua: Lua, timeout: float = 10.0):
+        self.lua = lua
+        self.timeout = timeout
+        self.lua_codes = []
+        self.results = None  # The return values in order of the snippets, after the batch ran
+
+    def __enter__(self) -> 'LuaBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def run(self, lua_code: str) -> int:
+        """
+        Add Lua code to the batch.
+
+        :param lua_code: Lua code to run
+        :return: The index of this snippets return value in :attr:`results`
+        """
+        self.lua_codes.append(lua_code)
+        return len(self.lua_codes) - 1
+
+    def flush(self) -> list:
+        """
+        Run all collected snippets with a single request. This is done automatically at the end of the with block.
+
+        Failed snippets get their :class:`miney.LuaError` as result. After all results are stored in :attr:`results`,
+        the first of these errors is raised.
+
+        :return: A list with the return value of every snippet. Multiple values as a tuple.
+        """
+        if not self.lua_codes:  # nothing to send
+            self.results = []
+            return self.results
+
+        lua = io.StringIO()
+        lua.write(_BATCH_HEAD)
+        for index, lua_code in enumerate(self.lua_codes, 1):
+            lua.write(f"results[{index}] = run({_lua_quote(lua_code)})\n")
+        lua.write("return results")
+        self.lua_codes = []
+
+        results = []
+        error = None
+        for result in self.lua.run(lua.getvalue(), timeout=self.timeout) or []:
+            if not result[0]:  # pcall failed
+                results.append(miney.LuaError("Lua-Error: " + str(result[1] if len(result) > 1 else "unknown")))
+                error = error or results[-1]
+                continue
+            values = result[1:]
+            results.append(values[0] if len(values) == 1 else (tuple(values) if values else None))
+        self.results = results
+        if error:
+            raise error
+        return results
+
+
+# Lua keywords can't be used as bare table keys
+_LUA_RESERVED = frozenset({
+    "and", "break", "do", "else", "elseif", "end", "false", "for", "function", "goto", "if", "in", "local", "nil",
+    "not", "or", "repeat", "return", "then", "true", "until", "while"
+})
+
+
+@lru_cache(maxsize=256)
+def _is_lua_name(key) -> bool:
+    """
+    Check if a table key can be written as bare Lua name, like {x=1} instead of {["x"]=1}.
+
+    :param key: The table key
+    :return: True or False
+    """
+    return type(key) is str and key.isidentifier() and max(key) < "\x80" and key not in _LUA_RESERVED
+
+
+# Escapes for Lua short strings. Control characters get decimal escapes with 3 digits, so a following digit
+# isn't read as part of the escape. JSON's \u00XX escapes aren't valid Lua.
+_LUA_STRING_ESCAPES = {code: "\\{:03d}".format(code) for code in [*range(0x20), 0x7f]}
+_LUA_STRING_ESCAPES.update({ord("\\"): "\\\\", ord('"'): '\\"', ord("\n"): "\\n", ord("\r"): "\\r"})
+
+
+def _lua_quote(data: str) -> str:
+    """
+    Quote a string as Lua string literal.
+
+    :param data: The string to quote
+    :return: The quoted string
+    """
+    return '"' + data.translate(_LUA_STRING_ESCAPES) + '"'
+
+
+def _dump_list(write, data) -> None:
+    write("{")
+    first = True
+    for item in data:
+        if not first:
+            write(", ")
+        first = False
+        _dump_into(write, item)
+    write("}")
+
+
+def _dump_dict(write, data) -> None:
+    write("{")
+    first = True
+    for k, v in data.items():
+        if not first:
+            write(", ")
+        first = False
+        if _is_lua_name(k):
+            write(k)
+            write("=")
+        else:
+            write("[")
+            _dump_into(write, k)
+            write("]=")
+        _dump_into(write, v)
+    write("}")
+
+
+# Writers by exact type, so most values need only one dict lookup
+_DUMPERS = {
+    type(None): lambda write, data: write("nil"),
+    bool: lambda write, data: write(data and "true" or "false"),
+    int: lambda write, data: write("{}".format(data)),
+    float: lambda write, data: write("{}".format(data)),
+    str: lambda write, data: write(_lua_quote(data)),
+    list: _dump_list,
+    tuple: _dump_list,
+    dict: _dump_dict,
+}
+
+
+def _dump_into(write, data) -> None:
+    # credits:
+    # https://stackoverflow.com/questions/54392760/serialize-a-dict-as-lua-table/54392761#54392761
+    dumper = _DUMPERS.get(type(data))
+    if dumper is None:  # subclasses of the supported types
+        if isinstance(data, str):
+            dumper = _DUMPERS[str]
+        elif isinstance(data, bool):
+            dumper = _DUMPERS[bool]
+        elif isinstance(data, (int, float)):
+            dumper = _DUMPERS[float]
+        elif isinstance(data, (list, tuple)):
+            dumper = _dump_list
+        elif isinstance(data, dict):
+            dumper = _dump_dict
+        else:
+            raise ValueError("Unknown type {}".format(type(data)))
+    dumper(write, data)
@@ -1,12 +1,44 @@
 import socket
 import json
-import math
+from collections import deque
+from itertools import count
 from typing import Dict, Union
 import time
-import string
-from random import choices
 import miney
 
+try:  # orjson is optional, but much faster with large results like node lists
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data) -> str:
+        # like json.dumps, convert int, float, bool and None dict keys to strings instead of raising
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> str:
+        return json.dumps(data)
+
+# Lua snippets that never change
+_PLAYERS_LUA = """
+local players = {}
+for _,player in ipairs(minetest.get_connected_players()) do
+    table.insert(players,player:get_player_name())
+end
+return players
+"""
+
+_TOOLS_LUA = """
+local nodes = {}
+for name, def in pairs(minetest.registered_tools) do
+    table.insert(nodes, name)
+end return nodes
+"""
+
+# Results of requests that timed out are never picked up, so we only keep this many unclaimed results
+_RESULT_QUEUE_SIZE = 1000
+
 
 class Minetest:
     """__init__([server, playername, password, [port]])
@@ -29,6 +61,12 @@ class Minetest:
     :param str password: Your password
     :param int port: The apisocket port, defaults to 29999
     """
+    __slots__ = (
+        "server", "port", "playername", "password", "connection", "clientid", "event_queue", "result_queue",
+        "callbacks", "_result_ids", "_alive", "_receive_buffer", "_receive_view", "_time_of_day_cache",
+        "_time_of_day_ttl", "_lua", "_chat", "_node", "_player", "_tools_cache", "_tool", "__weakref__"
+    )
+
     def __init__(self, server: str = "127.0.0.1", playername: str = None, password: str = "", port: int = 29999):
         """
         Connect to the minetest server.
@@ -36,6 +74,7 @@ class Minetest:
         :param server: IP or DNS name of an minetest server with installed apisocket mod
         :param port: The apisocket port, defaults to 29999
         """
+        self._alive = False  # True while we have an open connection
         self.server = server
         self.port = port
         if playername:
@@ -47,50 +86,124 @@ class Minetest:
         # setup connection
         self.connection = None
         self._connect()
+        self._alive = True
 
-        self.event_queue = []  # List for collected but unprocessed events
+        self.event_queue = deque()  # Collected but unprocessed events, oldest first
         self.result_queue = {}  # List for unprocessed results
+        self._result_ids = count(1)  # ids to match results to requests
         self.callbacks = {}
 
+        self._time_of_day_cache = None  # (time of day, time.monotonic() of the request, time_speed)
+        self._time_of_day_ttl = 0.25  # how long in seconds we calculate the time of day without a request
+
         self.clientid = None  # The clientid we got from mineysocket after successful authentication
         self._authenticate()
 
         # objects representing local properties
         self._lua: miney.lua.Lua = miney.Lua(self)
         self._chat: miney.chat.Chat = miney.Chat(self)
-        self._node: miney.node.Node = miney.Node(self)
-
-        player = self.lua.run(
-            """
-            local players = {}
-            for _,player in ipairs(minetest.get_connected_players()) do
-                table.insert(players,player:get_player_name())
-            end
-            return players
-            """
-        )
-        if player:
-            player = [] if len(player) == 0 else player
-        else:
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Request the connected players and available node types again and forget the cached tools and time of day.
+
+        Miney requests these only once at connect, so call this after players joined or left the server.
+
+        :return: None
+        """
+        bootstrap = self._bootstrap()
+
+        players = bootstrap["players"]
+        if players == {}:  # an empty Lua table arrives as empty JSON object
+            players = []
+        if not isinstance(players, list):
             raise miney.DataError("Received malformed player data.")
 
-        self._player = miney.PlayerIterable(self, player)
+        # build everything first, so a failure doesn't leave us half refreshed
+        node = miney.Node(self, bootstrap["node_types"])
+        player = miney.PlayerIterable(self, players)
 
-        self._tools_cache = self.lua.run(
-            """
-            local nodes = {}
-            for name, def in pairs(minetest.registered_tools) do
-                table.insert(nodes, name)
-            end return nodes
-            """
-        )
-        self._tool = miney.ToolIterable(self, self._tools_cache)
+        self._node: miney.node.Node = node
+        self._player = player
+        self._tools_cache = None  # tool names, requested on first access of Minetest.tool
+        self._tool = None
+        self._time_of_day_cache = None
+
+    def _bootstrap(self) -> dict:
+        """
+        Get players and node types in one request instead of one request each.
+
+        :return: A dict with "players" and "node_types" lists
+        """
+        players, node_types = self.lua.run_many([_PLAYERS_LUA, miney.node._NODE_TYPES_LUA])
+        return {"players": players, "node_types": node_types}
 
     def _connect(self):
         # setup connection
         self.connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):  # detect a crashed server within ~30 seconds, where supported
+            try:
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 15)
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 5)
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            except OSError:  # the constants exist, but the running OS doesn't support them (older Windows)
+                pass
         self.connection.settimeout(2.0)
-        self.connection.connect((self.server, self.port))
+        try:
+            self.connection.connect((self.server, self.port))
+        except OSError:
+            self.connection.close()
+            raise
+        self._receive_buffer = bytearray()  # received bytes, that aren't a complete message yet
+        self._receive_view = memoryview(bytearray(65536))  # reused for every recv_into
+
+    def _reconnect(self, attempts: int = 3, delay: float = 0.25):
+        """
+        Replace a lost connection and authenticate again, so the next request isn't rejected by mineysocket.
+
+        A server that is restarting gets a few attempts with a growing pause in between, wrong credentials don't.
+
+        :param attempts: How often we try to connect
+        :param delay: Seconds to wait after the first failed attempt, doubled after every further attempt
+        :return: None
+        """
+        self.connection.close()
+        for attempt in range(attempts):
+            try:
+                self._connect()
+                self._authenticate()
+                return
+            except (OSError, miney.LuaResultTimeout):
+                self.connection.close()
+                if attempt == attempts - 1:
+                    raise
+                time.sleep(delay * 2 ** attempt)
+
+    def _receive_message(self) -> dict:
+        """
+        Receive a single json message from mineysocket.
+
+        Messages are separated by newlines. Bytes after the newline stay in the buffer for the next call, so
+        multiple messages in one packet aren't lost.
+
+        :return: The decoded message
+        """
+        buffer = self._receive_buffer
+        searched = 0
+        end = buffer.find(b"\n")
+        while end < 0:
+            searched = len(buffer)
+            received = self.connection.recv_into(self._receive_view)
+            if not received:
+                raise ConnectionAbortedError("Connection closed by server")
+            buffer += self._receive_view[:received]
+            end = buffer.find(b"\n", searched)  # only search the new bytes
+        data = _json_loads(buffer[:end])
+        del buffer[:end + 1]
+        return data
 
     def _authenticate(self):
         """
@@ -117,29 +230,22 @@ class Minetest:
         :param data:
         :return:
         """
-        chunk_size = 4096
-        raw_data: bytes = str.encode(json.dumps(data) + "\n")
+        raw_data: bytes = str.encode(_json_dumps(data) + "\n")
 
         try:
-            if len(raw_data) < chunk_size:
-                self.connection.sendall(raw_data)
-            else:  # we need to break the message in chunks
-                for i in range(0, int(math.ceil((len(raw_data)/chunk_size)))):
-                    self.connection.sendall(
-                        raw_data[i * chunk_size:chunk_size + (i * chunk_size)]
-                    )
-                    time.sleep(0.01)  # Give luasocket a chance to read the buffer in time
-                    # todo: Protocol change, that every chunked message needs a response before sending the next
+            # sendall blocks while the servers receive window is full, so even large messages need no pauses
+            self.connection.sendall(raw_data)
         except ConnectionAbortedError:
-            self._connect()
+            self._reconnect()
             self.send(data)
 
     def receive(self, result_id: str = None, timeout: float = None) -> Union[str, bool]:
         """
         Receive data and events from minetest.
 
-        With an optional result_id this function waits for a result with that id by call itself until the right result
-        was received. **If lua.run() was used this is not necessary, cause miney already takes care of it.**
+        With an optional result_id this function keeps receiving until the result with that id arrives. Other results
+        received meanwhile are stored for later calls, events run their callbacks.
+        **If lua.run() was used this is not necessary, cause miney already takes care of it.**
 
         With the optional timeout the blocking waiting time for data can be changed.
 
@@ -165,30 +271,34 @@ class Minetest:
             else:
                 return result_data["result"]
 
-        # Check if we have to return something received earlier
-        if result_id in self.result_queue:
-            result = format_result(self.result_queue[result_id])
-            del self.result_queue[result_id]
-            return result
         # Without a result_id we run an event callback
-        elif not result_id and len(self.event_queue):
-            result = self.event_queue[0]
-            del self.event_queue[0]
-            self._run_callback(result)
-        try:
-            # Set a new timeout to prevent long waiting for a timeout
-            if timeout:
-                self.connection.settimeout(timeout)
-    
+        if not result_id and self.event_queue:
+            self._run_callback(self.event_queue.popleft())
+
+        # Set a new timeout to prevent long waiting for a timeout, settimeout costs a syscall so only on changes
+        if timeout and timeout != self.connection.gettimeout():
+            self.connection.settimeout(timeout)
+
+        # Loop until we got our result, instead of calling ourself again for every other message
+        while True:
+            # Check if we have to return something received earlier
+            if result_id in self.result_queue:
+                return format_result(self.result_queue.pop(result_id))
+
             try:
-                # receive the raw data and try to decode json
-                data_buffer = b""
-                while "\n" not in data_buffer.decode():
-                    data_buffer = data_buffer + self.connection.recv(4096)
-                data = json.loads(data_buffer.decode())
+                data = self._receive_message()
             except socket.timeout:
                 raise miney.LuaResultTimeout()
-    
+            except ConnectionAbortedError:
+                if result_id == "auth":  # a failed authentication is handled by the caller
+                    raise
+                self._reconnect()
+                if result_id:  # our request was lost with the old connection
+                    raise miney.SessionReconnected()
+                if timeout:  # the new connection starts with the default timeout
+                    self.connection.settimeout(timeout)
+                continue
+
             # process data
             if "result" in data:
                 if result_id:  # do we need a specific result?
@@ -196,6 +306,8 @@ class Minetest:
                         return format_result(data)
                 # We store this for later processing
                 self.result_queue[data["id"]] = data
+                if len(self.result_queue) > _RESULT_QUEUE_SIZE:  # drop the oldest, nobody waits for it anymore
+                    del self.result_queue[next(iter(self.result_queue))]
             elif "error" in data:
                 if data["error"] == "authentication error":
                     if self.clientid:
@@ -208,14 +320,10 @@ class Minetest:
                     raise miney.LuaError("Lua-Error: " + data["error"])
             elif "event" in data:
                 self._run_callback(data)
-    
-            # if we don't got our result we have to receive again
-            if result_id:
-                self.receive(result_id)
 
-        except ConnectionAbortedError:
-            self._connect()
-            self.receive(result_id, timeout)
+            # without a result_id a single message is enough, otherwise we receive again
+            if not result_id:
+                return
 
     def on_event(self, name: str, callback: callable) -> None:
         """
@@ -226,7 +334,7 @@ class Minetest:
         :return: None
         """
         # Match answer to request
-        result_id = ''.join(choices(string.ascii_lowercase + string.ascii_uppercase + string.digits, k=6))
+        result_id = str(next(self._result_ids))
         self.callbacks[name] = callback
         self.send({'activate_event': {'event': name}, 'id': result_id})
 
@@ -264,10 +372,10 @@ class Minetest:
         """
         Write a line in the servers logfile.
 
-        :param line: The log line
+        :param line: The log line, other objects than strings are converted with str()
         :return: None
         """
-        return self.lua.run('minetest.log("action", "{}")'.format(line))
+        return self.lua.call("minetest.log", "action", str(line))
 
     @property
     def player(self):
@@ -308,25 +416,54 @@ class Minetest:
         """
         Get and set the time of the day between 0 and 1, where 0 stands for midnight, 0.5 for midday.
 
+        Reads within a quarter second after the last request are calculated locally from the server's time speed,
+        instead of asking the server again.
+
         :return: time of day as float.
         """
-        return self.lua.run("return minetest.get_timeofday()")
+        if self._time_of_day_cache:
+            value, timestamp, time_speed = self._time_of_day_cache
+            elapsed = time.monotonic() - timestamp
+            if elapsed < self._time_of_day_ttl:
+                value = value + elapsed * time_speed / 86400  # time_speed is game days per real day
+                return value - 1 if value > 1 else value
+
+        value, time_speed = self.lua.run(
+            "return minetest.get_timeofday(), tonumber(minetest.settings:get(\"time_speed\")) or 72"
+        )
+        self._time_of_day_cache = (value, time.monotonic(), time_speed)
+        return value
 
     @time_of_day.setter
     def time_of_day(self, value: float):
         if 0 <= value <= 1:
-            self.lua.run("return minetest.set_timeofday({})".format(value))
+            self.lua.call("minetest.set_timeofday", value)
+            if self._time_of_day_cache:
+                self._time_of_day_cache = (value, time.monotonic(), self._time_of_day_cache[2])
         else:
             raise ValueError("Time value has to be between 0 and 1.")
 
     @property
-    def settings(self) -> dict:
+    def settings(self) -> 'miney.SettingsView':
         """
-        Receive all server settings defined in "minetest.conf".
+        Receive server settings defined in "minetest.conf".
+
+        **Changed after 0.2.2:** This returns a :class:`miney.SettingsView` instead of a dict. It works like a read-only
+        dict, but isn't one: use :meth:`miney.SettingsView.to_dict` where a real dict is needed, e.g. for json.dumps.
 
-        :return: A dict with all non-default settings.
+        Single settings are requested on access, iterating receives all non-default settings at once. Every access of
+        this property returns a new view, that requests current values.
+
+        :Example:
+
+            >>> mt.settings["time_speed"]
+            '72'
+            >>> mt.settings.to_dict()
+            {'name': 'MineyPlayer', 'time_speed': '72', ...}
+
+        :return: :class:`miney.SettingsView` with a dict like interface
         """
-        return self.lua.run("return minetest.settings:to_table()")
+        return miney.SettingsView(self)
 
     @property
     def tool(self) -> 'miney.ToolIterable':
@@ -365,6 +502,9 @@ class Minetest:
         :rtype: :class:`ToolIterable`
         :return: :class:`ToolIterable` object with categories. Look at the examples above for usage.
         """
+        if self._tool is None:  # most scripts never use tools, so we request them on first access
+            self._tools_cache = self.lua.run(_TOOLS_LUA)
+            self._tool = miney.ToolIterable(self, self._tools_cache)
         return self._tool
 
     def __del__(self) -> None:
@@ -373,10 +513,14 @@ class Minetest:
 
         :return: None
         """
-        self.connection.close()
+        if getattr(self, "_alive", False):
+            self._alive = False
+            self.connection.close()
 
     def __repr__(self):
         return '<minetest server "{}:{}">'.format(self.server, self.port)
 
     def __delete__(self, instance):
-        self.connection.close()
+        if self._alive:
+            self._alive = False
+            self.connection.close()
@@ -2,6 +2,16 @@ import miney
 from typing import Union
 from copy import deepcopy
 
+# Lua snippets that never change or are only filled in
+_NODE_TYPES_LUA = """
+local nodes = {}
+for name, def in pairs(minetest.registered_nodes) do
+    table.insert(nodes, name)
+end return nodes
+"""
+
+_GET_NODE_LUA = "return minetest.get_node({})"
+
 
 class Node:
     """
@@ -10,17 +20,12 @@ class Node:
     **Node manipulation is currently tested for up to 25.000 nodes, more optimization will come later**
 
     """
-    def __init__(self, mt: miney.Minetest):
+    def __init__(self, mt: miney.Minetest, types: list = None):
         self.mt = mt
 
-        self._types_cache = self.mt.lua.run(
-            """
-            local nodes = {}
-            for name, def in pairs(minetest.registered_nodes) do
-                table.insert(nodes, name)
-            end return nodes
-            """
-        )
+        # Minetest already fetches the types while connecting
+        self._types_cache = types if types is not None else self.mt.lua.run(_NODE_TYPES_LUA)
+        self._types_set = frozenset(self._types_cache)  # for fast "in" checks
         self._types = TypeIterable(self, self._types_cache)
 
     @property
@@ -108,7 +113,7 @@ class Node:
         # Set many blocks
         elif type(_nodes) is list:
 
-            lua = ""
+            lua = []  # joined at the end, adding to a string copies it for every node
             # Loop over nodes, modify name/type, position/offset and generate lua code
             for node in _nodes:
                 # default name to 'air'
@@ -125,10 +130,10 @@ class Node:
                     node["z"] = node["z"] + offset["z"]
 
                 if node["name"] != "ignore":
-                    lua = lua + f"minetest.set_node(" \
-                                f"{self.mt.lua.dumps({'x': node['x'], 'y': node['y'], 'z': node['z']})}, " \
-                                f"{{name=\"{node['name']}\"}})\n"
-            self.mt.lua.run(lua)
+                    lua.append(f"minetest.set_node("
+                               f"{self.mt.lua.dumps({'x': node['x'], 'y': node['y'], 'z': node['z']})}, "
+                               f"{{name=\"{node['name']}\"}})\n")
+            self.mt.lua.run("".join(lua))
 
     def get(self, position: dict, position2: dict = None, relative: bool = True,
             offset: dict = None) -> Union[dict, list]:
@@ -155,10 +160,10 @@ class Node:
                 _position["y"] = _position["y"] + offset["y"]
                 _position["z"] = _position["z"] + offset["z"]
 
-            node = self.mt.lua.run(f"return minetest.get_node({self.mt.lua.dumps(position)})")
-            node["x"] = position["x"]
-            node["y"] = position["y"]
-            node["z"] = position["z"]
+            node = self.mt.lua.run(_GET_NODE_LUA.format(self.mt.lua.dumps(_position)))
+            node["x"] = _position["x"]
+            node["y"] = _position["y"]
+            node["z"] = _position["z"]
             return node
         elif type(position) is dict and type(position2) is dict:  # Multiple nodes
             _position = deepcopy(position)
@@ -236,6 +241,9 @@ class TypeIterable:
         # todo: list(mt.node.type.default) should return only default group
         return iter(self.__parent._types_cache)
 
+    def __contains__(self, item):
+        return item in self.__parent._types_set
+
     def __getitem__(self, item_key):
         if type(self.__parent) is not type(self):  # if we don't have a category below
             return self.__getattribute__(item_key)
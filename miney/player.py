@@ -308,20 +308,16 @@ class Player:
 class PlayerIterable:
     """Player, implemented as iterable for easy autocomplete in the interactive shell"""
     def __init__(self, minetest: miney.Minetest, online_players: list = None):
-        if online_players:
-            self.__online_players = online_players
-            self.__mt = minetest
+        self.__online_players = online_players or []
+        self.__mt = minetest
 
-            # update list
-            for player in online_players:
-                self.__setattr__(player, miney.Player(minetest, player))
-
-    def __iter__(self):
-        player_object = []
+        # update list
         for player in self.__online_players:
-            player_object.append(miney.Player(self.__mt, player))
+            self.__setattr__(player, miney.Player(minetest, player))
 
-        return iter(player_object)
+    def __iter__(self):
+        # reuse the player objects created above, every new object would cost a request
+        return iter([self.__getattribute__(player) for player in self.__online_players])
 
     def __getitem__(self, item_key) -> Player:
         if item_key in self.__online_players:
@@ -0,0 +1,72 @@
+from collections.abc import Mapping
+import miney
+
+
+class SettingsView(Mapping):
+    """
+    Read-only view on the server settings defined in "minetest.conf". Settings, that only have their default value,
+    aren't included.
+
+    Single settings are requested from the server on access, so only the requested value is transferred.
+    Iterating, :func:`len`, :meth:`keys`, :meth:`values`, :meth:`items` and :meth:`to_dict` receive the complete
+    settings table with one request. This view keeps that table and answers following single accesses from it, so
+    ``dict(mt.settings)`` needs only one request. Get a new view from :attr:`miney.Minetest.settings` for fresh values.
+
+    :Example:
+
+        >>> settings = mt.settings
+        >>> settings["time_speed"]
+        '72'
+        >>> "time_speed" in settings
+        True
+        >>> json.dumps(settings.to_dict())
+        '{"name": "MineyPlayer", "time_speed": "72", ...}'
+    """
+    def __init__(self, mt: miney.Minetest):
+        self.mt = mt
+        self._table = None  # the complete settings table, after it was received once
+
+    def __repr__(self):
+        return '<minetest settings>'
+
+    def __getitem__(self, key: str) -> str:
+        if self._table is not None:
+            value = self._table.get(key)
+        else:
+            # same source as the complete table, but only this value is transferred
+            value = self.mt.lua.run(f"return minetest.settings:to_table()[{self.mt.lua.dumps(key)}]")
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return iter(self._receive())
+
+    def __len__(self):
+        return len(self._receive())
+
+    def keys(self):
+        return self._receive().keys()
+
+    def values(self):
+        return self._receive().values()
+
+    def items(self):
+        return self._receive().items()
+
+    def to_dict(self) -> dict:
+        """
+        Receive all settings as dict, e.g. to serialize them.
+
+        :return: A dict with all non-default settings.
+        """
+        return dict(self._receive())
+
+    def _receive(self) -> dict:
+        """
+        Receive all settings and keep them for following single accesses.
+
+        :return: A dict with all non-default settings.
+        """
+        self._table = self.mt.lua.run("return minetest.settings:to_table()") or {}
+        return self._table
@@ -3,9 +3,7 @@ from math import sqrt, acos, degrees
 
 
 class Vector:
-    x = float()
-    y = float()
-    z = float()
+    __slots__ = ("x", "y", "z", "__weakref__")
 
     def __init__(self, x: float = 0, y: float = 0, z: float = 0):
         self.x = x
@@ -32,4 +32,7 @@ setuptools.setup(
         "Topic :: Games/Entertainment"
     ],
     python_requires='>=3.6',
+    extras_require={
+        "orjson": ["orjson"]
+    },
 )
@@ -52,10 +52,14 @@ def test_minetest(mt: miney.Minetest):
     assert "default:stone" in nodes
 
     assert (mt.log("Pytest is running...")) is None
+    assert mt.log(42) is None  # not only strings
 
     settings = mt.settings
     assert "secure.trusted_mods" in settings
     assert "name" in settings
+    assert "name" in list(mt.settings)  # iteration and membership use the same settings
+    assert isinstance(settings.to_dict(), dict)
+    assert dict(settings) == settings.to_dict()
 
     assert 0 < mt.time_of_day < 1.1
     mt.time_of_day = 0.99
@@ -84,6 +88,43 @@ def test_lua(mt: miney.Minetest):
     )
     assert returnvalues == (12, 'test', [8, '9'], {'var': 99})
 
+    # multiple snippets in one request
+    with mt.lua.batch() as batch:
+        batch.run("return 12")
+        batch.run("return 12, \"test\"")
+        batch.run("minetest.log(\"action\", \"Pytest is running...\")")
+    assert batch.results == [12, (12, "test"), None]
+    assert mt.lua.run_many(["return 12", "return \"test\""]) == [12, "test"]
+
+    with pytest.raises(miney.LuaError) as e:
+        with mt.lua.batch() as batch:
+            batch.run("return 12")
+            batch.run("error(\"failing snippet\")")
+            batch.run("this isn't lua")
+    assert batch.results[0] == 12  # results of the other snippets are kept
+    assert isinstance(batch.results[1], miney.LuaError)
+    assert isinstance(batch.results[2], miney.LuaError)  # syntax errors only fail their own snippet
+
+    assert mt.lua.run_many([]) == []  # empty batches send nothing
+
+    # python data to lua code, identifiers as bare keys, everything else in brackets
+    assert mt.lua.dumps({"x": 1, "y": 2.5, "z": -3}) == '{x=1, y=2.5, z=-3}'
+    assert mt.lua.dumps({"end": 1, "not a name": 2, "ü": 3}) == '{["end"]=1, ["not a name"]=2, ["ü"]=3}'
+    assert mt.lua.dumps({1: "a", 2: None}) == '{[1]="a", [2]=nil}'
+    assert mt.lua.dumps((1, (2, 3))) == '{1, {2, 3}}'
+    assert mt.lua.dumps([None, True, False]) == '{nil, true, false}'
+    assert mt.lua.dumps(None) == 'nil'
+
+    # strings are quoted with Lua escapes, JSON's \u00XX isn't valid Lua
+    assert mt.lua.dumps("say \"hi\"\\") == '"say \\"hi\\"\\\\"'
+    assert mt.lua.dumps("line\r\nnext") == '"line\\r\\nnext"'
+    assert mt.lua.dumps("\x1b(c@#f00)red\x7f") == '"\\027(c@#f00)red\\127"'
+
+    # call arguments arrive unchanged, also with quotes, backslashes and colour codes
+    text = "say \"hi\" C:\\dir \x1b(c@#f00)red"
+    assert mt.lua.call("tostring", text) == text
+    assert mt.lua.call("string.len", text) == len(text)
+
 
 def test_players(mt: miney.Minetest):
     """
@@ -107,3 +148,22 @@ def test_players(mt: miney.Minetest):
     assert len(player.name) > 0
 
     assert str(player) == "<minetest player \"{}\">".format(player.name)
+
+
+def test_refresh(mt: miney.Minetest):
+    """
+    Test reloading players, node types and tools.
+
+    :param mt: fixture
+    :return: None
+    """
+    mt.refresh()
+
+    assert len(mt.player) >= 1
+    assert isinstance(mt.player[0], miney.player.Player)
+    assert "default:stone" in mt.node.type
+    assert mt.node.type.default.dirt == "default:dirt"
+
+    # tools are requested again on first access
+    assert mt.tool.default.pick_mese == "default:pick_mese"
+    assert "default:pick_mese" in list(mt.tool)
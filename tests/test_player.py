@@ -63,3 +63,7 @@ def test_player(mt: miney.Minetest, mt_player: miney.Player):
     assert 3.15 > mt_player.look_horizontal > 3.13
 
     mt_player.inventory.add("default:axe_wood")
+
+    # quotes and backslashes in item names don't break the generated Lua
+    mt_player.inventory.add("default:axe_wood\"\\", 1)
+    mt_player.inventory.remove("default:axe_wood\"\\", 1)